@@ -0,0 +1,68 @@
+import os
+import pathlib
+import sys
+
+import pytest
+
+# Make app.py importable from the tests; this runs once at collection
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+
+from app import app
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_env_vars():
+    """
+    Mocks the environment variables used for the database connection.
+    This prevents the app from trying to connect to a real database.
+    No test changes these values, so they are set once for the whole session
+    and the previous values are restored afterwards.
+    """
+    env = {
+        'MYSQL_DATABASE_USER': 'test_user',
+        'MYSQL_DATABASE_PASSWORD': 'test_password',
+        'MYSQL_DATABASE_DB': 'test_db',
+        'MYSQL_DATABASE_HOST': 'localhost',
+    }
+    previous = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    yield
+    for key, value in previous.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Creates a test client for the Flask application.
+    The client is built once per module and shared by all the tests,
+    since each test only issues isolated requests against it.
+    """
+    # Configure the app for testing
+    app.config['TESTING'] = True
+    # Disable CSRF token checking for testing purposes
+    app.config['WTF_CSRF_ENABLED'] = False
+    # Templates never change during a test run, so skip the mtime checks on each render
+    app.jinja_env.auto_reload = False
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture(autouse=True)
+def clear_session(client):
+    """
+    Clears the shared client's session after each test to keep tests isolated.
+    """
+    yield
+    with client.session_transaction() as sess:
+        sess.clear()
+
+@pytest.fixture(scope="module")
+def auth_cookie():
+    """
+    Signs a session cookie for a logged in user once per module.
+    Tests set it on the client instead of writing the session themselves.
+    """
+    serializer = app.session_interface.get_signing_serializer(app)
+    return serializer.dumps({'user': 'test_user_id'})
@@ -1,93 +1,97 @@
 import pytest
-import json
 from unittest import mock
-import os
-import sys
 
-# Add the parent directory to the path to import app.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app
 
-# Import the Flask app from the provided app.py file
-# Assumes app.py is in the same directory or a directory that's been added to the path
-from app import app, mysql
+# Parametrize data shared by several cases, built once at import time
+_SIGNUP_DATA = {'inputName': 'Test User', 'inputEmail': 'test@example.com', 'inputPassword': 'password123'}
+_DB_ERR = [('An error occurred.',)]
+_DB_ERR_STR = str(('An error occurred.',))
+_WISHES = [
+    (1, 'Title 1', 'Desc 1', 'test_user_id', '2023-01-01'),
+    (2, 'Title 2', 'Desc 2', 'test_user_id', '2023-01-02')
+]
+_EXPECTED_WISHES = [
+    {'Id': 1, 'Title': 'Title 1', 'Description': 'Desc 1', 'Date': '2023-01-01'},
+    {'Id': 2, 'Title': 'Title 2', 'Description': 'Desc 2', 'Date': '2023-01-02'}
+]
+_LOGIN_EXC = Exception('Test DB Error')
+_ADD_WISH_EXC = Exception('Add Wish Error')
+_GET_WISH_EXC = Exception('Get Wish Error')
 
 @pytest.fixture
-def client():
+def mock_connect():
     """
-    Creates a test client for the Flask application.
-    This fixture is used by all the tests to simulate requests.
+    Patches the MySQL connection so no test touches a real database.
+    Yields the patched connect mock together with a prebuilt cursor,
+    so tests only have to set the cursor's fetchall result.
     """
-    # Configure the app for testing
-    app.config['TESTING'] = True
-    # Disable CSRF token checking for testing purposes
-    app.config['WTF_CSRF_ENABLED'] = False
-    with app.test_client() as client:
-        yield client
+    with mock.patch('app.mysql.connect') as mock_connect:
+        cursor = mock.Mock(spec=['execute', 'fetchall', 'callproc', 'close'])
+        mock_connect.return_value.cursor.return_value = cursor
+        yield mock_connect, cursor
 
-@pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch):
+@pytest.fixture
+def db_result(request, mock_connect):
     """
-    Mocks the environment variables used for the database connection.
-    This prevents the app from trying to connect to a real database.
+    Configures the mocked database for an indirectly parametrized result.
+    An exception is raised on connect; anything else is returned by fetchall.
     """
-    monkeypatch.setenv('MYSQL_DATABASE_USER', 'test_user')
-    monkeypatch.setenv('MYSQL_DATABASE_PASSWORD', 'test_password')
-    monkeypatch.setenv('MYSQL_DATABASE_DB', 'test_db')
-    monkeypatch.setenv('MYSQL_DATABASE_HOST', 'localhost')
+    mock_connect, mock_cursor = mock_connect
+    result = request.param
+    if isinstance(result, Exception):
+        mock_connect.side_effect = result
+    else:
+        mock_cursor.fetchall.return_value = result
+    return result
 
 @pytest.mark.parametrize("route, expected_status_code", [
-    ('/', 200),
-    ('/showSignUp', 200),
-    ('/showSignIn', 200),
-    ('/showAddWish', 200)
+    pytest.param('/', 200, id="index", marks=pytest.mark.benchmark),
+    pytest.param('/showSignUp', 200, id="sign-up"),
+    pytest.param('/showSignIn', 200, id="sign-in"),
+    pytest.param('/showAddWish', 200, id="add-wish"),
 ])
-@mock.patch('app.mysql.connect')
-def test_get_routes(mock_connect, client, route, expected_status_code):
+def test_get_routes(client, route, expected_status_code):
     """
     Tests various GET routes to ensure they return a 200 status code.
     This single test replaces four separate functions.
+    These routes only render templates, so the database is not patched.
     """
     response = client.get(route)
     assert response.status_code == expected_status_code
 
-@pytest.mark.parametrize("data, mock_db_result, expected_status, expected_response_part", [
+@pytest.mark.parametrize("data, db_result, expected_status, expected_response_part", [
     # Test case for a successful sign-up
-    ({'inputName': 'Test User', 'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [], 200, {'message': 'User created successfully !'}),
+    pytest.param(_SIGNUP_DATA, [], 200, {'message': 'User created successfully !'}, id="ok"),
     # Test case for a database error during sign-up
-    ({'inputName': 'Test User', 'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [('An error occurred.',)], 200, {'error': str(('An error occurred.',))}),
+    pytest.param(_SIGNUP_DATA, _DB_ERR, 200, {'error': _DB_ERR_STR}, id="db-error"),
     # Test case for missing form fields (Flask handles this with a 400 error)
-    ({'inputName': 'Test User'}, [], 400, None),
-])
-@mock.patch('app.mysql.connect')
-def test_sign_up(mock_connect, client, data, mock_db_result, expected_status, expected_response_part):
+    pytest.param({'inputName': 'Test User'}, [], 400, None, id="missing-fields"),
+], indirect=["db_result"])
+def test_sign_up(client, data, db_result, expected_status, expected_response_part):
     """
     Tests the signUp route with different scenarios (success, DB error, missing fields).
     """
-    mock_cursor = mock_connect.return_value.cursor.return_value
-    mock_cursor.fetchall.return_value = mock_db_result
-    
     response = client.post('/signUp', data=data)
     
     assert response.status_code == expected_status
     if expected_response_part:
-        assert json.loads(response.data) == expected_response_part
+        assert response.get_json(force=True) == expected_response_part
 
-@pytest.mark.parametrize("data, mock_db_result, expected_status, expected_redirect_location, expected_message", [
+@pytest.mark.parametrize("data, db_result, expected_status, expected_redirect_location, expected_message", [
     # Test case for a successful login
-    ({'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [('user_id', 'Test User', 'test@example.com', 'password123')], 302, '/userHome', None),
+    pytest.param({'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [('user_id', 'Test User', 'test@example.com', 'password123')], 302, '/userHome', None, id="ok"),
     # Test case for a wrong password
-    ({'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [('user_id', 'Test User', 'test@example.com', 'wrong_password')], 200, None, b'Wrong Email address or Password'),
+    pytest.param({'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, [('user_id', 'Test User', 'test@example.com', 'wrong_password')], 200, None, b'Wrong Email address or Password', id="wrong-password"),
     # Test case for a user not found
-    ({'inputEmail': 'nonexistent@example.com', 'inputPassword': 'password123'}, [], 200, None, b'Wrong Email address or Password'),
-])
-@mock.patch('app.mysql.connect')
-def test_validate_login(mock_connect, client, data, mock_db_result, expected_status, expected_redirect_location, expected_message):
+    pytest.param({'inputEmail': 'nonexistent@example.com', 'inputPassword': 'password123'}, [], 200, None, b'Wrong Email address or Password', id="not-found"),
+    # Test case for a database exception
+    pytest.param({'inputEmail': 'test@example.com', 'inputPassword': 'password123'}, _LOGIN_EXC, 200, None, b'Test DB Error', id="db-exception"),
+], indirect=["db_result"])
+def test_validate_login(client, data, db_result, expected_status, expected_redirect_location, expected_message):
     """
-    Tests the validateLogin route for success, wrong password, and user not found scenarios.
+    Tests the validateLogin route for success, wrong password, user not found and database exception scenarios.
     """
-    mock_cursor = mock_connect.return_value.cursor.return_value
-    mock_cursor.fetchall.return_value = mock_db_result
-    
     response = client.post('/validateLogin', data=data)
     
     assert response.status_code == expected_status
@@ -98,40 +102,26 @@ def test_validate_login(mock_connect, client, data, mock_db_result, expected_sta
     if expected_message:
         assert expected_message in response.data
 
-@mock.patch('app.mysql.connect', side_effect=Exception('Test DB Error'))
-def test_validate_login_exception(mock_connect, client):
-    """
-    Tests the exception handling in the validateLogin route.
-    Mocks the database connection to raise an exception.
-    """
-    data = {'inputEmail': 'test@example.com', 'inputPassword': 'password123'}
-    response = client.post('/validateLogin', data=data)
-    
-    assert response.status_code == 200
-    assert b'Test DB Error' in response.data
-
 @pytest.mark.parametrize("has_session, expected_status_code, expected_message_part", [
-    (True, 200, b'Bucket List'),
-    (False, 200, b'Unauthorized Access'),
+    pytest.param(True, 200, b'Bucket List', id="logged-in"),
+    pytest.param(False, 200, b'Unauthorized Access', id="unauthorized"),
 ])
-def test_user_home(client, has_session, expected_status_code, expected_message_part):
+def test_user_home(client, auth_cookie, has_session, expected_status_code, expected_message_part):
     """
     Tests the userHome route with and without an active session.
     """
-    with client.session_transaction() as sess:
-        if has_session:
-            sess['user'] = 'test_user_id'
-        response = client.get('/userHome')
-        assert response.status_code == expected_status_code
-        assert expected_message_part in response.data
+    if has_session:
+        client.set_cookie(app.config['SESSION_COOKIE_NAME'], auth_cookie)
+    response = client.get('/userHome')
+    assert response.status_code == expected_status_code
+    assert expected_message_part in response.data
 
-def test_logout(client):
+def test_logout(client, auth_cookie):
     """
     Tests the logout route.
     Ensures the session is cleared and a redirect to the main page occurs.
     """
-    with client.session_transaction() as sess:
-        sess['user'] = 'test_user_id'
+    client.set_cookie(app.config['SESSION_COOKIE_NAME'], auth_cookie)
     response = client.get('/logout')
     
     assert response.status_code == 302
@@ -140,31 +130,23 @@ def test_logout(client):
     with client.session_transaction() as sess:
         assert 'user' not in sess
 
-@pytest.mark.parametrize("has_session, data, mock_db_result, expected_status, expected_location, expected_message", [
+@pytest.mark.parametrize("has_session, data, db_result, expected_status, expected_location, expected_message", [
     # Test case for successful wish addition
-    (True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [], 302, '/userHome', None),
+    pytest.param(True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [], 302, '/userHome', None, id="ok", marks=pytest.mark.benchmark),
     # Test case for a database error
-    (True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [('An error occurred!',)], 200, None, b'An error occurred!'),
+    pytest.param(True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [('An error occurred!',)], 200, None, b'An error occurred!', id="db-error"),
     # Test case for unauthorized access (no session)
-    (False, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [], 200, None, b'Unauthorized Access'),
+    pytest.param(False, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, [], 200, None, b'Unauthorized Access', id="unauthorized"),
     # Test case for database exception
-    (True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, Exception('Add Wish Error'), 200, None, b'Add Wish Error'),
-])
-@mock.patch('app.mysql.connect')
-def test_add_wish(mock_connect, client, has_session, data, mock_db_result, expected_status, expected_location, expected_message):
+    pytest.param(True, {'inputTitle': 'Test Wish', 'inputDescription': 'A description'}, _ADD_WISH_EXC, 200, None, b'Add Wish Error', id="db-exception"),
+], indirect=["db_result"])
+def test_add_wish(client, auth_cookie, has_session, data, db_result, expected_status, expected_location, expected_message):
     """
     Tests the addWish route with different scenarios.
     """
-    with client.session_transaction() as sess:
-        if has_session:
-            sess['user'] = 'test_user_id'
-        
-    if isinstance(mock_db_result, Exception):
-        mock_connect.side_effect = mock_db_result
-    else:
-        mock_cursor = mock_connect.return_value.cursor.return_value
-        mock_cursor.fetchall.return_value = mock_db_result
-    
+    if has_session:
+        client.set_cookie(app.config['SESSION_COOKIE_NAME'], auth_cookie)
+
     response = client.post('/addWish', data=data)
     
     assert response.status_code == expected_status
@@ -173,31 +155,20 @@ def test_add_wish(mock_connect, client, has_session, data, mock_db_result, expec
     if expected_message:
         assert expected_message in response.data
 
-@pytest.mark.parametrize("has_session, mock_db_result, expected_status, expected_message", [
+@pytest.mark.parametrize("has_session, db_result, expected_status, expected_message", [
     # Test case for successful wish retrieval
-    (True, [
-        (1, 'Title 1', 'Desc 1', 'test_user_id', '2023-01-01'),
-        (2, 'Title 2', 'Desc 2', 'test_user_id', '2023-01-02')
-    ], 200, None),
+    pytest.param(True, _WISHES, 200, None, id="ok"),
     # Test case for unauthorized access
-    (False, [], 200, b'Unauthorized Access'),
+    pytest.param(False, [], 200, b'Unauthorized Access', id="unauthorized"),
     # Test case for a database exception
-    (True, Exception('Get Wish Error'), 200, b'Get Wish Error'),
-])
-@mock.patch('app.mysql.connect')
-def test_get_wish(mock_connect, client, has_session, mock_db_result, expected_status, expected_message):
+    pytest.param(True, _GET_WISH_EXC, 200, b'Get Wish Error', id="db-exception"),
+], indirect=["db_result"])
+def test_get_wish(client, auth_cookie, has_session, db_result, expected_status, expected_message):
     """
     Tests the getWish route with different scenarios.
     """
-    with client.session_transaction() as sess:
-        if has_session:
-            sess['user'] = 'test_user_id'
-
-    if isinstance(mock_db_result, Exception):
-        mock_connect.side_effect = mock_db_result
-    else:
-        mock_cursor = mock_connect.return_value.cursor.return_value
-        mock_cursor.fetchall.return_value = mock_db_result
+    if has_session:
+        client.set_cookie(app.config['SESSION_COOKIE_NAME'], auth_cookie)
 
     response = client.get('/getWish')
 
@@ -205,9 +176,6 @@ def test_get_wish(mock_connect, client, has_session, mock_db_result, expected_st
     if expected_message:
         assert expected_message in response.data
     else:
-        wishes_dict = json.loads(response.data)
-        expected_data = [
-            {'Id': 1, 'Title': 'Title 1', 'Description': 'Desc 1', 'Date': '2023-01-01'},
-            {'Id': 2, 'Title': 'Title 2', 'Description': 'Desc 2', 'Date': '2023-01-02'}
-        ]
-        assert wishes_dict == expected_data
+        # The app serves json.dumps() output as text/html, hence force=True
+        wishes_dict = response.get_json(force=True)
+        assert wishes_dict == _EXPECTED_WISHES